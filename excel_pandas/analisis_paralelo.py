@@ -0,0 +1,71 @@
+from sklearn.cluster import KMeans
+from sklearn.metrics import silhouette_score
+import pandas as pd
+from .semantica import RANDOM_STATE, ajustar_semantica, vectorizar
+
+# Estado compartido por cada proceso del pool, fijado por `inicializar_worker`.
+_stop_words_worker = None
+_textos_worker: dict = {}
+_parametros_tfidf_worker: dict = {}
+_matrices_worker: dict = {}
+
+
+def inicializar_worker(stop_words, textos_por_hoja: dict = None, max_df: float = 0.8, min_df: int = 3) -> None:
+    """
+    Inicializa un proceso del pool con las stop words compartidas y, para la
+    búsqueda de `n_clusters`, con los textos de cada hoja y los parámetros TF-IDF.
+    Así cada proceso los recibe una sola vez y no con cada tarea.
+    """
+    global _stop_words_worker, _textos_worker, _parametros_tfidf_worker, _matrices_worker
+    _stop_words_worker = stop_words
+    _textos_worker = textos_por_hoja or {}
+    _parametros_tfidf_worker = {"max_df": max_df, "min_df": min_df}
+    _matrices_worker = {}
+
+
+def analizar_textos(textos: pd.Series, n_clusters: int, max_df: float, min_df: int) -> tuple:
+    """
+    Tarea del pool para `LibroPandas.analizar_texto_hojas`, con las stop words del proceso.
+
+    Retorna:
+    --------
+    tuple
+        (índice de los textos, clusters, coordenadas PCA)
+    """
+    _, _, _, clusters, pca_coords = ajustar_semantica(textos, n_clusters, max_df, min_df, _stop_words_worker)
+    return textos.index, clusters, pca_coords
+
+
+def evaluar_n_clusters(nombre: str, n_clusters: int) -> float:
+    """
+    Tarea del pool para `LibroPandas.buscar_n_clusters`: coeficiente de silueta de
+    KMeans con `n_clusters` sobre la hoja `nombre`. La matriz TF-IDF de cada hoja
+    se calcula como mucho una vez por proceso.
+
+    Retorna:
+    --------
+    float
+        NaN si la hoja no tiene vocabulario, si KMeans no produce `n_clusters`
+        grupos distintos o si la silueta no está definida.
+    """
+    if nombre not in _matrices_worker:
+        try:
+            _, _matrices_worker[nombre] = vectorizar(_textos_worker[nombre], stop_words=_stop_words_worker,
+                                                     **_parametros_tfidf_worker)
+        except ValueError:
+            _matrices_worker[nombre] = None
+    X_tfidf = _matrices_worker[nombre]
+    if X_tfidf is None:
+        return float("nan")
+
+    n_muestras = X_tfidf.shape[0]
+    if not 2 <= n_clusters < n_muestras:
+        return float("nan")
+    try:
+        clusters = KMeans(n_clusters=n_clusters, random_state=RANDOM_STATE).fit_predict(X_tfidf)
+        n_labels = len(set(clusters))
+        if n_labels < n_clusters or not 2 <= n_labels < n_muestras:
+            return float("nan")
+        return float(silhouette_score(X_tfidf, clusters))
+    except ValueError:
+        return float("nan")
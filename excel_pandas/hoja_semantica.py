@@ -1,11 +1,9 @@
 from wordcloud import WordCloud
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
-from sklearn.decomposition import PCA
 import matplotlib.pyplot as plt
 import pandas as pd
 from collections import Counter
 from .hoja import HojaPandas
+from .semantica import ajustar_semantica
 
 class HojaSemantica(HojaPandas):
     def __init__(self, data=None, nombre="Semantica", **kwargs):
@@ -28,17 +26,11 @@ class HojaSemantica(HojaPandas):
             Número de clusters KMeans.
         """
         textos = self[columna].dropna().astype(str)
-        self.vectorizer = TfidfVectorizer(stop_words=stop_words, max_df=max_df, min_df=min_df)
-        self.X_tfidf = self.vectorizer.fit_transform(textos)
-
-        self.model = KMeans(n_clusters=n_clusters, random_state=42)
-        self.clusters = self.model.fit_predict(self.X_tfidf)
+        (self.vectorizer, self.model, self.X_tfidf,
+         self.clusters, self.pca_coords) = ajustar_semantica(textos, n_clusters, max_df, min_df, stop_words)
 
         # Guardar resultados
         self.loc[textos.index, "Cluster"] = self.clusters
-
-        pca = PCA(n_components=2)
-        self.pca_coords = pca.fit_transform(self.X_tfidf.toarray())
         self.loc[textos.index, "PCA1"] = self.pca_coords[:, 0]
         self.loc[textos.index, "PCA2"] = self.pca_coords[:, 1]
 
@@ -145,5 +137,3 @@ class HojaSemantica(HojaPandas):
         plt.gca().invert_yaxis()
         plt.tight_layout()
         plt.show()
-
-
@@ -1,4 +1,5 @@
-from typing import Dict
+from typing import Dict, Iterable, List
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from .hoja import HojaPandas
 import bibtexparser
@@ -310,7 +311,139 @@ class LibroPandas:
         with pd.ExcelWriter(path) as writer:
             for nombre, hoja in self.hojas.items():
                 hoja.to_excel(writer, sheet_name=nombre, index=False)
-    
+
+    def analizar_texto_hojas(self, nombres_hojas: List[str] = None, columna: str = "Abstract",
+                             n_clusters: int = 4, max_df: float = 0.8, min_df: int = 3,
+                             stop_words="english", max_workers: int = None) -> None:
+        """
+        Ejecuta TF-IDF + KMeans + PCA sobre varias hojas en paralelo (un proceso por hoja)
+        y escribe las columnas 'Cluster', 'PCA1' y 'PCA2' en cada hoja.
+        Si alguna hoja falla, no se modifica ninguna.
+
+        Parámetros:
+        -----------
+        nombres_hojas : list[str], opcional
+            Hojas a analizar. Si no se especifica, se analizan todas.
+        columna : str
+            Columna de texto a analizar.
+        n_clusters : int
+            Número de clusters KMeans.
+        max_df, min_df :
+            Umbrales de frecuencia de documento para TF-IDF.
+        stop_words : str o list[str]
+            Stop words compartidas por todos los procesos.
+        max_workers : int, opcional
+            Número máximo de procesos. Por defecto, uno por hoja hasta el número de CPUs.
+        """
+        from .analisis_paralelo import inicializar_worker, analizar_textos
+
+        self._validar_max_workers(max_workers)
+        textos_por_hoja = self._textos_por_hoja(nombres_hojas, columna)
+        if not textos_por_hoja:
+            return
+
+        pool = self._crear_pool(len(textos_por_hoja), max_workers, inicializar_worker,
+                                (_normalizar_stop_words(stop_words),))
+        with pool:
+            futuros = {
+                nombre: pool.submit(analizar_textos, textos, n_clusters, max_df, min_df)
+                for nombre, textos in textos_por_hoja.items()
+            }
+            resultados = {nombre: futuro.result() for nombre, futuro in futuros.items()}
+
+        for nombre, (indice, clusters, pca_coords) in resultados.items():
+            hoja = self.hojas[nombre]
+            hoja.loc[indice, "Cluster"] = clusters
+            hoja.loc[indice, "PCA1"] = pca_coords[:, 0]
+            hoja.loc[indice, "PCA2"] = pca_coords[:, 1]
+
+    def buscar_n_clusters(self, nombres_hojas: List[str] = None, columna: str = "Abstract",
+                          rango_clusters: Iterable[int] = range(2, 11), max_df: float = 0.8,
+                          min_df: int = 3, stop_words="english", max_workers: int = None) -> pd.DataFrame:
+        """
+        Búsqueda en rejilla de `n_clusters` para KMeans, en paralelo (una tarea por
+        combinación hoja / n_clusters), puntuando cada una con el coeficiente de silueta.
+
+        Parámetros:
+        -----------
+        nombres_hojas : list[str], opcional
+            Hojas a evaluar. Si no se especifica, se evalúan todas.
+        columna : str
+            Columna de texto a analizar.
+        rango_clusters : iterable de int
+            Valores de `n_clusters` a probar.
+        max_df, min_df :
+            Umbrales de frecuencia de documento para TF-IDF.
+        stop_words : str o list[str]
+            Stop words para TF-IDF.
+        max_workers : int, opcional
+            Número máximo de procesos. Por defecto, uno por tarea hasta el número de CPUs.
+
+        Retorna:
+        --------
+        pd.DataFrame
+            Columnas 'Hoja', 'n_clusters' y 'Silhouette' (NaN si la hoja no tiene
+            vocabulario TF-IDF o si KMeans no logra `n_clusters` grupos distintos).
+        """
+        from .analisis_paralelo import inicializar_worker, evaluar_n_clusters
+
+        self._validar_max_workers(max_workers)
+        rango_clusters = list(rango_clusters)
+        textos_por_hoja = self._textos_por_hoja(nombres_hojas, columna)
+        tareas = [(nombre, k) for nombre in textos_por_hoja for k in rango_clusters]
+        if not tareas:
+            return pd.DataFrame(columns=["Hoja", "n_clusters", "Silhouette"])
+
+        # Los textos viajan una vez por proceso; cada proceso calcula la matriz
+        # TF-IDF de una hoja la primera vez que la necesita.
+        pool = self._crear_pool(len(tareas), max_workers, inicializar_worker,
+                                (_normalizar_stop_words(stop_words), textos_por_hoja, max_df, min_df))
+        with pool:
+            futuros = [pool.submit(evaluar_n_clusters, nombre, k) for nombre, k in tareas]
+            resultados = [
+                {"Hoja": nombre, "n_clusters": k, "Silhouette": futuro.result()}
+                for (nombre, k), futuro in zip(tareas, futuros)
+            ]
+        return pd.DataFrame(resultados)
+
+    def _textos_por_hoja(self, nombres_hojas: List[str], columna: str) -> Dict[str, pd.Series]:
+        """
+        Devuelve los textos no nulos de `columna` para cada hoja seleccionada.
+        """
+        if nombres_hojas is None:
+            nombres_hojas = list(self.hojas.keys())
+
+        textos_por_hoja = {}
+        for nombre in nombres_hojas:
+            hoja = self.obtener_hoja(nombre)
+            if hoja is None:
+                raise ValueError(f"No existe la hoja '{nombre}' en el libro.")
+            if columna not in hoja.columns:
+                raise ValueError(f"La hoja '{nombre}' no tiene la columna '{columna}'.")
+            textos_por_hoja[nombre] = hoja[columna].dropna().astype(str)
+        return textos_por_hoja
+
+    @staticmethod
+    def _validar_max_workers(max_workers: int) -> None:
+        """
+        Verifica que `max_workers` sea None o un entero positivo.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"`max_workers` debe ser al menos 1 (recibido: {max_workers}).")
+
+    @staticmethod
+    def _crear_pool(n_tareas: int, max_workers: int = None, initializer=None, initargs: tuple = ()) -> ProcessPoolExecutor:
+        """
+        Crea un pool de procesos acotado por `max_workers`, el número de tareas y de CPUs.
+        `initializer` e `initargs` se pasan tal cual a ProcessPoolExecutor.
+        """
+        limite = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        return ProcessPoolExecutor(
+            max_workers=min(limite, n_tareas),
+            initializer=initializer,
+            initargs=initargs,
+        )
+
 
  
 
@@ -338,3 +471,13 @@ def _parsear_rango_hojas(rango: str) -> list[int]:
         else:
             indices.add(int(parte) - 1)
     return sorted(indices)
+
+
+def _normalizar_stop_words(stop_words):
+    """
+    Convierte cualquier colección de stop words en una lista (el formato que acepta
+    TfidfVectorizer); los valores "english" o None se dejan igual.
+    """
+    if stop_words is None or isinstance(stop_words, str):
+        return stop_words
+    return sorted(set(stop_words))
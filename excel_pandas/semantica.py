@@ -0,0 +1,39 @@
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.cluster import KMeans
+from sklearn.decomposition import PCA
+import pandas as pd
+
+# Semilla común para todos los ajustes KMeans del paquete.
+RANDOM_STATE = 42
+
+
+def vectorizar(textos: pd.Series, max_df: float = 0.8, min_df: int = 3, stop_words="english") -> tuple:
+    """
+    Ajusta TF-IDF sobre una serie de textos.
+
+    Retorna:
+    --------
+    tuple
+        (vectorizer, matriz TF-IDF)
+    """
+    vectorizer = TfidfVectorizer(stop_words=stop_words, max_df=max_df, min_df=min_df)
+    return vectorizer, vectorizer.fit_transform(textos)
+
+
+def ajustar_semantica(textos: pd.Series, n_clusters: int = 4, max_df: float = 0.8, min_df: int = 3,
+                      stop_words="english") -> tuple:
+    """
+    TF-IDF + KMeans + PCA sobre una serie de textos.
+
+    Retorna:
+    --------
+    tuple
+        (vectorizer, modelo KMeans, matriz TF-IDF, clusters, coordenadas PCA)
+    """
+    vectorizer, X_tfidf = vectorizar(textos, max_df, min_df, stop_words)
+
+    model = KMeans(n_clusters=n_clusters, random_state=RANDOM_STATE)
+    clusters = model.fit_predict(X_tfidf)
+
+    pca_coords = PCA(n_components=2).fit_transform(X_tfidf.toarray())
+    return vectorizer, model, X_tfidf, clusters, pca_coords
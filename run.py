@@ -71,3 +71,48 @@ for nombre, hoja in libro_csv.hojas.items():
 # ╰─────────────────────────────────────────────╯
 
 libro_csv.guardar_como_excel("salida.xlsx")
+
+
+
+# ╭─────────────────────────────────────────────╮
+# │ Ejemplo 5: Análisis semántico de varias hojas en paralelo
+# ╰─────────────────────────────────────────────╯
+# En Windows los procesos del pool reimportan este script: el código que
+# lanza el pool debe ir dentro de `if __name__ == "__main__":`.
+
+if __name__ == "__main__":
+    from excel_pandas.hoja_semantica import HojaSemantica
+
+    print("\n Ejemplo 5: Análisis semántico en paralelo")
+    articulos = LibroPandas.desde_bib("data/articulos.bib").obtener_hoja("BibTeX")
+    anio = pd.to_numeric(articulos["Year"], errors="coerce")
+    proyectos = {
+        "Antes2020": articulos[anio < 2020].reset_index(drop=True),
+        "Desde2020": articulos[anio >= 2020].reset_index(drop=True),
+    }
+
+    libro_bib = LibroPandas("Proyectos")
+    for nombre, df in proyectos.items():
+        libro_bib.agregar_hoja(nombre, df)
+    libro_bib.analizar_texto_hojas(n_clusters=3, min_df=2, max_workers=2)
+
+    # Mismo resultado que HojaSemantica.analizar_texto, hoja por hoja
+    for nombre, df in proyectos.items():
+        hoja_sem = HojaSemantica(df.copy(), nombre=nombre)
+        hoja_sem.analizar_texto(n_clusters=3, min_df=2)
+        hoja = libro_bib.obtener_hoja(nombre)
+        iguales = all(hoja[c].equals(hoja_sem[c]) for c in ("Cluster", "PCA1", "PCA2"))
+        print(f" Hoja: {nombre} — igual a HojaSemantica: {iguales}")
+
+    # Si una hoja falla (aquí 'Corta', con 2 filas y min_df=2), ninguna se modifica
+    libro_fallo = LibroPandas("ConFallo")
+    libro_fallo.agregar_hoja("Antes2020", proyectos["Antes2020"])
+    libro_fallo.agregar_hoja("Corta", articulos.head(2))
+    try:
+        libro_fallo.analizar_texto_hojas(n_clusters=3, min_df=2)
+    except ValueError as e:
+        print(f" Falla esperada: {e}")
+    print(f" 'Antes2020' sin cambios: {'Cluster' not in libro_fallo.obtener_hoja('Antes2020').columns}")
+
+    # Búsqueda de n_clusters: NaN en 'Corta' y donde n_clusters no es válido
+    print(libro_fallo.buscar_n_clusters(rango_clusters=range(1, 7), min_df=2))